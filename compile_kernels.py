@@ -0,0 +1,20 @@
+"""This file is compiling the order block detection kernel ahead of time.
+
+Running it builds the 'ob_kernel' extension module next to the sources.
+order_block_detector imports it when present, so the detection loop starts
+without the numba JIT warm-up. The extension is specialised for the float32
+prices OrderBlockDetector uses; rebuild it after changing the kernel.
+"""
+
+from numba.pycc import CC
+
+import order_block_detector
+
+
+cc = CC("ob_kernel")
+cc.export("detect_ob_bos_f32", order_block_detector._DETECT_OB_BOS_SIGNATURE)(
+    order_block_detector._detect_ob_bos_loop.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,12 +1,78 @@
 from utils import *
 
 
+def _cache_path(ticker: str, period: str, interval: str) -> Path:
+    """Build the on-disk cache location for one download.
+
+    The current date is part of the file name, so a cached download is only
+    reused on the day it was made and the next day's run fetches fresh bars.
+    Intraday intervals ("1m" to "90m", "1h") gain new bars during the day,
+    so their file name also carries the current hour.
+
+    Args:
+        ticker (str): The stock ticker symbol.
+        period (str): The time period of the download.
+        interval (str): The frequency of the download.
+
+    Returns:
+        pathlib.Path: The parquet file inside CACHE_DIR for this download.
+    """
+    now = datetime.datetime.now()
+    stamp = now.strftime("%Y-%m-%dT%H") if interval.endswith(("m", "h")) else now.date().isoformat()
+    return CACHE_DIR / f"{ticker}_{period}_{interval}_{stamp}.parquet"
+
+
+def _store_in_cache(data: pd.DataFrame, path: Path) -> None:
+    """Write a downloaded DataFrame to the on-disk cache.
+
+    Empty downloads (unknown ticker, network failure) are not cached so that
+    the next run retries them.
+
+    Args:
+        data (pandas.DataFrame): The downloaded market data.
+        path (pathlib.Path): The cache file to write.
+    """
+    if data.empty:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data.to_parquet(path, compression="zstd")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_historical_data(path: Path, ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """Read one download from the on-disk cache, downloading it if missing.
+
+    The result is also kept in memory, keyed on the cache path, so repeated
+    calls in one process skip even the parquet read and roll over with the
+    file name at the end of the day.
+
+    Args:
+        path (pathlib.Path): The cache file of this download.
+        ticker (str): The stock ticker symbol.
+        period (str): The time period of the download.
+        interval (str): The frequency of the download.
+
+    Returns:
+        pandas.DataFrame: The market data. Callers must not modify it.
+    """
+    if path.exists():
+        return pd.read_parquet(path)
+    data = yf.download(ticker, period=period, interval=interval)
+    _store_in_cache(data, path)
+    return data
+
+
 def fetch_historical_data(ticker: str, period: str, interval: str = "1d") -> pd.DataFrame:
     """Fetch historical market data for ticker using the Yahoo Finance API.
 
     This function retrieves historical data for the given 'TICKER' over the
     specified 'PERIOD' and at the provided 'interval'. By default, the data is
-    fetched at daily intervals unless specified otherwise.
+    fetched at daily intervals unless specified otherwise. Downloads are
+    cached as parquet files in CACHE_DIR for the rest of the day, or the rest
+    of the hour for intraday intervals, so repeated runs read the file
+    instead of going over the network, and repeated calls within one run
+    reuse the loaded data. Each call gets its own copy, so callers may
+    modify it freely.
 
     Args:
         ticker (str): The stock ticker symbol for which to fetch the data.
@@ -21,4 +87,39 @@ def fetch_historical_data(ticker: str, period: str, interval: str = "1d") -> pd.
                           for the specified ticker,including columns for open,
                           high, low, close prices, and volume.
     """
-    return yf.download(ticker, period=period, interval=interval)
+    path = _cache_path(ticker, period, interval)
+    return _load_historical_data(path, ticker, period, interval).copy()
+
+
+def fetch_watchlist_data(tickers: list[str], period: str,
+                         interval: str = "1d") -> dict[str, pd.DataFrame]:
+    """Fetch historical market data for several tickers in one request.
+
+    This function downloads all 'tickers' with a single multi-ticker
+    yf.download call grouped by ticker, and splits the result into one
+    DataFrame per symbol so each can be processed like the output of
+    fetch_historical_data. yfinance fetches the symbols on its own thread
+    pool, and tickers already in the on-disk cache are not downloaded again.
+
+    Args:
+        tickers (list of str): The stock ticker symbols to fetch.
+        period (str): The time period over which to fetch the data.
+        interval (str, optional): The frequency at which to fetch the data.
+                                  Default is "1d".
+
+    Returns:
+        dict: Ticker symbols mapped to DataFrames with the open, high, low,
+              close prices and volume. Rows before a ticker's first trade
+              are dropped.
+    """
+    paths = {ticker: _cache_path(ticker, period, interval) for ticker in tickers}
+    frames = {ticker: pd.read_parquet(path) for ticker, path in paths.items() if path.exists()}
+    missing = [ticker for ticker in tickers if ticker not in frames]
+    if missing:
+        data = yf.download(missing, period=period, interval=interval,
+                           group_by="ticker", threads=True)
+        grouped = isinstance(data.columns, pd.MultiIndex)
+        for ticker in missing:
+            frames[ticker] = (data[ticker] if grouped else data).dropna(how="all")
+            _store_in_cache(frames[ticker], paths[ticker])
+    return {ticker: frames[ticker] for ticker in tickers}
@@ -4,7 +4,7 @@ from utils import *
 def calculate_pdh_pdl(data: pd.DataFrame) -> pd.DataFrame:
     """Calculate the Previous Day High (PDH) and Previous Day Low (PDL).
 
-    This function adds two new columns to the DataFrame 'data': 'PDH' and 'PDL'
+    This function adds two new columns to a copy of 'data': 'PDH' and 'PDL'.
     'PDH' is derived from shifting the 'High' column down by one position,
     representing the high of the previous day. Similarly, 'PDL' is from
     shifting the 'Low' column down by one position, representing the low of
@@ -16,35 +16,101 @@ def calculate_pdh_pdl(data: pd.DataFrame) -> pd.DataFrame:
                                 and low prices respectively.
 
     Returns:
-        pandas.DataFrame: The modified DataFrame
+        pandas.DataFrame: A copy of the DataFrame
                           with two new columns 'PDH' and 'PDL'.
     """
-    data["PDH"] = data["High"].shift(1)
-    data["PDL"] = data["Low"].shift(1)
-    return data
+    high = data["High"].to_numpy(dtype=np.float64)
+    low = data["Low"].to_numpy(dtype=np.float64)
+    pdh = np.full(len(high), np.nan)
+    pdh[1:] = high[:-1]
+    pdl = np.full(len(low), np.nan)
+    pdl[1:] = low[:-1]
+    return data.assign(PDH=pdh, PDL=pdl)
+
+
+@njit(cache=True)
+def push_min_candidate(candidates: np.ndarray, front: int, back: int,
+                       low: np.ndarray, i: int) -> int:
+    """Push bar i onto a monotonic deque of rolling minimum candidates.
+
+    Candidates with a higher low than bar i can never be the minimum of a
+    later window and are dropped from the back first, so the lows of the
+    remaining candidates strictly increase from front to back. This is the
+    step shared by _rolling_min and the order block detection loop.
+
+    Args:
+        candidates (numpy.ndarray): Deque buffer of bar positions.
+        front (int): Position of the oldest live candidate in the buffer.
+        back (int): One past the newest live candidate in the buffer.
+        low (numpy.ndarray): The 'Low' prices.
+        i (int): Bar to push.
+
+    Returns:
+        int: The new back of the deque.
+    """
+    while back > front and low[candidates[back - 1]] > low[i]:
+        back -= 1
+    candidates[back] = i
+    return back + 1
+
+
+@njit(cache=True)
+def _rolling_min(low: np.ndarray, window: int) -> np.ndarray:
+    """Compute the rolling minimum of low in one pass.
+
+    The candidates for the minimum are kept as a monotonic deque of
+    positions whose lows strictly increase from front to back. Every
+    position is pushed and popped at most once, so the pass is O(N)
+    whatever the window length. As in pandas' rolling minimum, a window
+    that contains a NaN low has no minimum, so NaN lows are not pushed and
+    only the position of the last one is kept.
+
+    Args:
+        low (numpy.ndarray): The 'Low' prices.
+        window (int): The number of bars in each window.
+
+    Returns:
+        numpy.ndarray: The minimum of the window ending at each bar, NaN
+                       until the first window is complete and for
+                       windows with a NaN low, in the dtype of low.
+    """
+    n = len(low)
+    rolling_min = np.full(n, np.nan, dtype=low.dtype)
+    deque = np.empty(n, dtype=np.int32)
+    front = back = 0
+    last_nan = -window
+    for i in range(n):
+        if np.isnan(low[i]):
+            last_nan = i
+        else:
+            back = push_min_candidate(deque, front, back, low, i)
+        while back > front and deque[front] <= i - window:
+            front += 1
+        if i >= window - 1 and i - last_nan >= window:
+            rolling_min[i] = low[deque[front]]
+    return rolling_min
 
 
 def calculate_structure_low(data: pd.DataFrame) -> pd.DataFrame:
     """Calculate the structure lows in data based on rolling minimum values.
 
     This function computes the rolling minimum of the 'Low' price over a
-    specified window (RANGE_CANDLE) and assigns this rolling minimum to a
-    new column 'StructureLow' in the input DataFrame. It also calculates
-    the index of the minimum value within each window and stores
-    this index in 'StructureLowIndex'. The rolling
-    minimum is shifted by one to prevent lookahead bias.
+    specified window (RANGE_CANDLE), shifted by one bar to prevent
+    lookahead bias, and adds it as the column 'StructureLow' to a copy of
+    the DataFrame. Windows that contain a NaN low are NaN, as with
+    data['Low'].rolling(RANGE_CANDLE).min().shift(1), and the column keeps
+    the dtype of 'Low'. The order block detection tracks the structure low
+    itself, so neither main.py nor watchlist.py calls this function.
 
     Args:
         data (pandas.DataFrame): A DataFrame containing a 'Low' column
 
     Returns:
-        pandas.DataFrame: The original DataFrame modified to include
-                          two new columns: 'StructureLow' - the rolled and
-                          shifted minimum values of the 'Low' price,
-                          'StructureLowIndex' - the index of the minimum
-                          value within each window.
+        pandas.DataFrame: A copy of the DataFrame extended with the column
+                          'StructureLow' - the rolled and shifted minimum
+                          values of the 'Low' price.
     """
-    low_rolling_min = data["Low"].rolling(window=RANGE_CANDLE).min()
-    data["StructureLow"] = low_rolling_min.shift(1)
-    data["StructureLowIndex"] = low_rolling_min.idxmin()
-    return data
+    low = np.ascontiguousarray(data["Low"].to_numpy(dtype=np.float64))
+    structure_low = np.full(len(low), np.nan)
+    structure_low[1:] = _rolling_min(low, RANGE_CANDLE)[:-1]
+    return data.assign(StructureLow=structure_low)
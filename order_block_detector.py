@@ -1,4 +1,375 @@
 from utils import *
+import data_processor
+
+
+BOX_DTYPE: np.dtype = np.dtype([("start_idx", "i8"), ("high", "f4"), ("low", "f4")])
+BOS_DTYPE: np.dtype = np.dtype([("start_idx", "i8"), ("y0", "f4"),
+                                ("end_idx", "i8"), ("y1", "f4"), ("mode", "u1")])
+
+
+def _previous_bar(values: np.ndarray, initial: float) -> np.ndarray:
+    """
+    Shifts values one bar later, filling the first bar with initial.
+
+    Args:
+        values (np.ndarray): Values known after each bar.
+        initial (float): Value to report before the first bar.
+
+    Returns:
+        np.ndarray: The values known on entering each bar.
+    """
+    shifted = np.empty_like(values)
+    shifted[:1] = initial
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+@njit(cache=True)
+def _restarted_extrema(high: np.ndarray, low: np.ndarray, up: np.ndarray, down: np.ndarray,
+                       range_candle: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes running extrema that restart at every up or down candle.
+
+    Both extrema start from 0 at range_candle, and every bar takes the
+    new value with a single compare and select, without a branch on the
+    segment boundaries. The bar's value is taken unless the running value
+    beats it, as Python's max and min do, so a NaN bar makes the extremum
+    NaN for that bar and the next bar starts over from its own value.
+
+    Args:
+        high (np.ndarray): High prices.
+        low (np.ndarray): Low prices.
+        up (np.ndarray): Whether each bar is a tracked up candle.
+        down (np.ndarray): Whether each bar is a tracked down candle.
+        range_candle (int): Index of the first candle to track.
+
+    Returns:
+        tuple: Two arrays:
+            - running_high (np.ndarray): Highest high since the last up
+              candle, including the current bar.
+            - running_low (np.ndarray): Lowest low since the last down
+              candle, including the current bar.
+    """
+    running_high = np.zeros_like(high)
+    running_low = np.zeros_like(low)
+    last_high = last_low = high.dtype.type(0)
+    for i in range(range_candle, len(high)):
+        bar_high = high[i]
+        bar_low = low[i]
+        last_high = bar_high if up[i] or not last_high > bar_high else last_high
+        last_low = bar_low if down[i] or not last_low < bar_low else last_low
+        running_high[i] = last_high
+        running_low[i] = last_low
+    return running_high, running_low
+
+
+def _last_candle_trackers(open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                          close: np.ndarray, range_candle: int) -> tuple[np.ndarray, ...]:
+    """
+    Computes the last up and down candle the detection loop sees on each bar.
+
+    Element i of every returned array describes the state on entering bar i,
+    i.e. after the candles before it have been processed. The positions are
+    forward filled with a running maximum over the candle positions, and the
+    highest high since the last up candle and the lowest low since the last
+    down candle are running maxima/minima restarted at each such candle by
+    _restarted_extrema. Candles before range_candle are not tracked, and
+    every value starts from 0. The positions are int32, which covers any
+    realistic number of bars at half the memory traffic.
+
+    Args:
+        open_ (np.ndarray): Open prices.
+        high (np.ndarray): High prices.
+        low (np.ndarray): Low prices.
+        close (np.ndarray): Close prices.
+        range_candle (int): Index of the first candle to track.
+
+    Returns:
+        tuple: Six arrays:
+            - last_down_index (np.ndarray): Position of the last down candle.
+            - last_down (np.ndarray): High of the last down candle.
+            - last_low (np.ndarray): Lowest low since the last down candle.
+            - last_up_index (np.ndarray): Position of the last up candle.
+            - last_up_low (np.ndarray): Low of the last up candle.
+            - last_high (np.ndarray): Highest high since the last up candle.
+    """
+    positions = np.arange(len(close), dtype=np.int32)
+    tracked = positions >= range_candle
+    down = tracked & (close < open_)
+    up = tracked & (close > open_)
+
+    down_index = np.maximum.accumulate(np.where(down, positions, -1))
+    up_index = np.maximum.accumulate(np.where(up, positions, -1))
+    last_down_index = _previous_bar(down_index, -1)
+    last_up_index = _previous_bar(up_index, -1)
+    last_down = np.where(last_down_index >= 0, high[last_down_index], 0.0)
+    last_up_low = np.where(last_up_index >= 0, low[last_up_index], 0.0)
+
+    running_high, running_low = _restarted_extrema(high, low, up, down, range_candle)
+
+    return (np.maximum(last_down_index, 0), last_down, _previous_bar(running_low, 0.0),
+            np.maximum(last_up_index, 0), last_up_low, _previous_bar(running_high, 0.0))
+
+
+@njit(cache=True)
+def _heap_push(keys: np.ndarray, starts: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+               size: int, key: float, start: int, high: float, low: float) -> int:
+    """
+    Adds a box to a binary min-heap stored in parallel arrays.
+
+    Args:
+        keys (np.ndarray): Heap keys, keys[0] is the smallest.
+        starts (np.ndarray): Start positions of the boxes.
+        highs (np.ndarray): Highs of the boxes.
+        lows (np.ndarray): Lows of the boxes.
+        size (int): Number of boxes in the heap.
+        key (float): Key of the new box.
+        start (int): Start position of the new box.
+        high (float): High of the new box.
+        low (float): Low of the new box.
+
+    Returns:
+        int: The new number of boxes in the heap.
+    """
+    pos = size
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if keys[parent] <= key:
+            break
+        keys[pos] = keys[parent]
+        starts[pos] = starts[parent]
+        highs[pos] = highs[parent]
+        lows[pos] = lows[parent]
+        pos = parent
+    keys[pos] = key
+    starts[pos] = start
+    highs[pos] = high
+    lows[pos] = low
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(keys: np.ndarray, starts: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+              size: int) -> int:
+    """
+    Removes the box with the smallest key from a binary min-heap.
+
+    Args:
+        keys (np.ndarray): Heap keys, keys[0] is the smallest.
+        starts (np.ndarray): Start positions of the boxes.
+        highs (np.ndarray): Highs of the boxes.
+        lows (np.ndarray): Lows of the boxes.
+        size (int): Number of boxes in the heap, at least one.
+
+    Returns:
+        int: The new number of boxes in the heap.
+    """
+    size -= 1
+    key = keys[size]
+    start = starts[size]
+    high = highs[size]
+    low = lows[size]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[child + 1] < keys[child]:
+            child += 1
+        if keys[child] >= key:
+            break
+        keys[pos] = keys[child]
+        starts[pos] = starts[child]
+        highs[pos] = highs[child]
+        lows[pos] = lows[child]
+        pos = child
+    keys[pos] = key
+    starts[pos] = start
+    highs[pos] = high
+    lows[pos] = low
+    return size
+
+
+@njit(cache=True)
+def _pin_box(starts: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+             pinned: int, start: int, high: float, low: float) -> int:
+    """
+    Stores a box that can never be invalidated at the end of the box arrays.
+
+    A box with a NaN heap key survives every close, as all comparisons
+    with NaN are false, and would break the heap order, so it is kept
+    outside the heap. Pinned boxes fill the arrays from the back, so they
+    share the buffers with the heap without overlapping it.
+
+    Args:
+        starts (np.ndarray): Start positions of the boxes.
+        highs (np.ndarray): Highs of the boxes.
+        lows (np.ndarray): Lows of the boxes.
+        pinned (int): Number of boxes already pinned.
+        start (int): Start position of the new box.
+        high (float): High of the new box.
+        low (float): Low of the new box.
+
+    Returns:
+        int: The new number of pinned boxes.
+    """
+    slot = len(starts) - pinned - 1
+    starts[slot] = start
+    highs[slot] = high
+    lows[slot] = low
+    return pinned + 1
+
+
+_DETECT_OB_BOS_SIGNATURE: str = (
+    "Tuple((i8[:], f4[:], f4[:], i8[:], f4[:], f4[:], i8[:, :], f4[:, :]))"
+    "(f4[:], f4[:], i4[:], f4[:], f4[:], i4[:], f4[:], f4[:], i8, i8, b1, b1)"
+)
+
+
+@njit(cache=True)
+def _detect_ob_bos_loop(low: np.ndarray, close: np.ndarray,
+                        last_down_index: np.ndarray, last_down: np.ndarray,
+                        last_low: np.ndarray, last_up_index: np.ndarray,
+                        last_up_low: np.ndarray, last_high: np.ndarray,
+                        window: int, range_candle: int, show_bear: bool,
+                        show_bull: bool) -> tuple[np.ndarray, ...]:
+    """
+    Runs the order block and BOS detection over raw price arrays.
+
+    The last up and down candle state per bar comes precomputed from
+    _last_candle_trackers. The structure low, the lowest low of the window
+    bars before each bar, is tracked with a monotonic deque. As with a
+    pandas rolling minimum, it is only defined once a full window precedes
+    the bar and none of the window's lows is NaN, so NaN lows are never
+    pushed and only their position is kept. Active boxes are kept as
+    binary min-heaps in preallocated arrays: short boxes keyed on their
+    high and long boxes on their negated low, so the boxes a close
+    invalidates are always on top and each removal costs O(log B). Boxes
+    with a NaN key are never invalidated and are pinned by _pin_box
+    instead. Prices keep the dtype of the inputs.
+
+    Args:
+        low (np.ndarray): Low prices.
+        close (np.ndarray): Close prices.
+        last_down_index (np.ndarray): Position of the last down candle per bar.
+        last_down (np.ndarray): High of the last down candle per bar.
+        last_low (np.ndarray): Lowest low since the last down candle per bar.
+        last_up_index (np.ndarray): Position of the last up candle per bar.
+        last_up_low (np.ndarray): Low of the last up candle per bar.
+        last_high (np.ndarray): Highest high since the last up candle per bar.
+        window (int): Number of bars the structure low is taken over.
+        range_candle (int): Index of the first candle to process.
+        show_bear (bool): Whether to record bearish BOS lines.
+        show_bull (bool): Whether to record bullish BOS lines.
+
+    Returns:
+        tuple: Eight arrays, with bar positions as int64 and prices in the
+            price dtype:
+            - long_start (np.ndarray): Start positions of the active long
+              order blocks.
+            - long_high (np.ndarray): Highs of the active long order blocks.
+            - long_low (np.ndarray): Lows of the active long order blocks.
+            - short_start (np.ndarray): Start positions of the active short
+              order blocks.
+            - short_high (np.ndarray): Highs of the active short order blocks.
+            - short_low (np.ndarray): Lows of the active short order blocks.
+            - bos_index (np.ndarray): BOS lines, one
+              (start_index, end_index, colour_mode) row each.
+            - bos_price (np.ndarray): BOS lines, one (start_y, end_y) row each.
+    """
+    n = len(close)
+    # asarray also gives the fallback's plain lists a (float64) dtype.
+    dtype = np.asarray(close[:1]).dtype
+    long_key = np.empty(n, dtype=dtype)
+    long_start = np.empty(n, dtype=np.int64)
+    long_high = np.empty(n, dtype=dtype)
+    long_low = np.empty(n, dtype=dtype)
+    short_start = np.empty(n, dtype=np.int64)
+    short_high = np.empty(n, dtype=dtype)
+    short_low = np.empty(n, dtype=dtype)
+    n_lines = 2 * n if show_bear or show_bull else 0
+    bos_index = np.empty((n_lines, 3), dtype=np.int64)
+    bos_price = np.empty((n_lines, 2), dtype=dtype)
+    n_long = n_short = n_bos = 0
+    n_long_pinned = n_short_pinned = 0
+    last_long_index = 0
+    candidates = np.empty(n, dtype=np.int64)
+    front = back = 0
+    last_nan = -window - 1
+    for i in range(max(range_candle - window, 0), min(range_candle, n)):
+        if np.isnan(low[i]):
+            last_nan = i
+        else:
+            back = data_processor.push_min_candidate(candidates, front, back, low, i)
+
+    for i in range(range_candle, n):
+        bar_close = close[i]
+        while back > front and candidates[front] < i - window:
+            front += 1
+
+        if i >= window and i - last_nan > window and low[i] < low[candidates[front]]:
+            up_index = last_up_index[i]
+            if i - up_index < 1000:
+                up_low = last_up_low[i]
+                up_high = last_high[i]
+                if up_high == up_high:
+                    n_short = _heap_push(short_high, short_start, short_high, short_low,
+                                         n_short, up_high, up_index, up_high, up_low)
+                else:
+                    n_short_pinned = _pin_box(short_start, short_high, short_low,
+                                              n_short_pinned, up_index, up_high, up_low)
+                if show_bear:
+                    bos_index[n_bos, 0] = up_index
+                    bos_index[n_bos, 1] = i
+                    bos_index[n_bos, 2] = 0
+                    bos_price[n_bos, 0] = up_low
+                    bos_price[n_bos, 1] = up_low
+                    n_bos += 1
+
+        while n_short > 0 and short_high[0] < bar_close:
+            down_index = last_down_index[i]
+            if i - down_index < 1000 and i > last_long_index:
+                down_high = last_down[i]
+                down_low = last_low[i]
+                if down_low == down_low:
+                    n_long = _heap_push(long_key, long_start, long_high, long_low,
+                                        n_long, -down_low, down_index, down_high, down_low)
+                else:
+                    n_long_pinned = _pin_box(long_start, long_high, long_low,
+                                             n_long_pinned, down_index, down_high, down_low)
+                if show_bull:
+                    bos_index[n_bos, 0] = down_index
+                    bos_index[n_bos, 1] = i
+                    bos_index[n_bos, 2] = 1
+                    bos_price[n_bos, 0] = down_high
+                    bos_price[n_bos, 1] = down_high
+                    n_bos += 1
+                last_long_index = i
+            n_short = _heap_pop(short_high, short_start, short_high, short_low, n_short)
+
+        while n_long > 0 and long_low[0] > bar_close:
+            n_long = _heap_pop(long_key, long_start, long_high, long_low, n_long)
+
+        if np.isnan(low[i]):
+            last_nan = i
+        else:
+            back = data_processor.push_min_candidate(candidates, front, back, low, i)
+
+    long_pinned = n - n_long_pinned
+    short_pinned = n - n_short_pinned
+    return (np.concatenate((long_start[:n_long], long_start[long_pinned:])),
+            np.concatenate((long_high[:n_long], long_high[long_pinned:])),
+            np.concatenate((long_low[:n_long], long_low[long_pinned:])),
+            np.concatenate((short_start[:n_short], short_start[short_pinned:])),
+            np.concatenate((short_high[:n_short], short_high[short_pinned:])),
+            np.concatenate((short_low[:n_short], short_low[short_pinned:])),
+            bos_index[:n_bos], bos_price[:n_bos])
+
+
+try:
+    from ob_kernel import detect_ob_bos_f32 as _detect_ob_bos
+except ImportError:
+    _detect_ob_bos = _detect_ob_bos_loop
 
 
 class OrderBlockDetector:
@@ -8,113 +379,131 @@ class OrderBlockDetector:
     Attributes:
         data (pd.DataFrame): The input financial market data.
         range_candle (int): The range of candles to consider for detection.
+        structure_window (int): Number of bars the structure low is taken over.
         show_bearish_bos (bool): Flag to indicate whether to show bearish BOS lines.
         show_bullish_bos (bool): Flag to indicate whether to show bullish BOS lines.
-        long_boxes (list): List to store detected long order blocks.
-        short_boxes (list): List to store detected short order blocks.
-        bos_lines (list): List to store detected BOS lines.
-        last_down_index (int): Index of the last down candle.
-        last_down (float): High value of the last down candle.
-        last_low (float): Low value of the last down candle.
-        last_up_index (int): Index of the last up candle.
-        last_long_index (int): Index of the last detected long order block.
-        last_up_low (float): Low value of the last up candle.
-        last_high (float): High value of the last up candle.
+        long_boxes (np.ndarray): BOX_DTYPE records of detected long order blocks.
+        short_boxes (np.ndarray): BOX_DTYPE records of detected short order blocks.
+        bos_lines (np.ndarray): BOS_DTYPE records of detected BOS lines.
     """
 
     def __init__(self, data: pd.DataFrame) -> None:
         """
         Initializes the OrderBlockDetector with the given data.
 
+        The price columns are cached as contiguous float32 arrays whatever
+        the memory layout of the DataFrame, so the kernels read them with
+        unit stride. float32 holds about seven significant digits, so prices
+        closer than that become equal, and a low that undercuts the
+        structure low by less is not detected as a break. The structure low
+        is tracked inside the detection loop, so the data does not need a
+        'StructureLow' column.
+
         Args:
             data (pd.DataFrame): The input financial market data.
         """
         self.data: pd.DataFrame = data
         self.range_candle: int = RANGE_CANDLE
+        self.structure_window: int = RANGE_CANDLE
         self.show_bearish_bos: bool = SHOW_BEARISH_BOS
         self.show_bullish_bos: bool = SHOW_BULLISH_BOS
-        self.long_boxes: list[tuple] = []
-        self.short_boxes: list[tuple] = []
-        self.bos_lines: list[tuple] = []
-        self.last_down_index = self.last_down = self.last_low = 0
-        self.last_up_index = self.last_long_index = self.last_up_low = self.last_high = 0
+        self.long_boxes: np.ndarray = np.empty(0, dtype=BOX_DTYPE)
+        self.short_boxes: np.ndarray = np.empty(0, dtype=BOX_DTYPE)
+        self.bos_lines: np.ndarray = np.empty(0, dtype=BOS_DTYPE)
+        self._open, self._high, self._low, self._close = (
+            np.ascontiguousarray(data[column].to_numpy(dtype=np.float32))
+            for column in ("Open", "High", "Low", "Close")
+        )
 
-    def detect_order_blocks_bos(self) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    def detect_order_blocks_bos(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Detects order blocks and Break of Structure (BOS) lines in the data.
 
+        The float32 price arrays cached on construction are handed to the
+        compiled detection loop and its results are packed into structured
+        arrays that refer to bars by integer position. When neither numba nor
+        the ob_kernel extension is available, the loop runs as Python over
+        plain lists, which index faster than NumPy arrays from the
+        interpreter. The extension does not need numba at runtime and always
+        takes the arrays.
+
         Returns:
-            tuple: A tuple containing three lists:
-                - long_boxes (list): Detected long order blocks.
-                - short_boxes (list): Detected short order blocks.
-                - bos_lines (list): Detected BOS lines.
+            tuple: A tuple containing three structured arrays:
+                - long_boxes (np.ndarray): Detected long order blocks as
+                  BOX_DTYPE (start_idx, high, low) records.
+                - short_boxes (np.ndarray): Detected short order blocks,
+                  same layout.
+                - bos_lines (np.ndarray): Detected BOS lines as BOS_DTYPE
+                  (start_idx, y0, end_idx, y1, mode) records.
         """
-        for i in range(self.range_candle, len(self.data)):
-            row = self.data.iloc[i]
-            self._detect_short_boxes(row, i)
-            self._detect_long_boxes(row)
-            self._update_last_indices(row, i)
-        return self.long_boxes, self.short_boxes, self.bos_lines
+        inputs = self._kernel_inputs()
+        if _detect_ob_bos is _detect_ob_bos_loop and not NUMBA_AVAILABLE:
+            inputs = [column.tolist() for column in inputs]
+        outputs = _detect_ob_bos(
+            *inputs, self.structure_window, self.range_candle,
+            self.show_bearish_bos, self.show_bullish_bos)
+        return self._store_results(*outputs)
 
-    def _detect_short_boxes(self, row: pd.Series, i: int) -> None:
+    def _kernel_inputs(self) -> tuple[np.ndarray, ...]:
         """
-        Detects short order blocks in the given row of data.
+        Collects the price and tracker arrays the detection kernels take.
 
-        Args:
-            row (pd.Series): A current row in data.
-            i (int): The current index in the data.
+        Returns:
+            tuple: The low and close arrays followed by the six
+                _last_candle_trackers arrays.
         """
-        if row["Low"] < row["StructureLow"]:
-            if i - self.last_up_index < 1000:
-                self.short_boxes.append(
-                    (self.last_up_index, self.last_high, self.last_up_low))
-                if self.show_bearish_bos:
-                    candle_colour_mode = 0
-                    self.bos_lines.append(
-                        (self.data.index[self.last_up_index], self.last_up_low,
-                         self.data.index[i], self.last_up_low, candle_colour_mode)
-                    )
-
-        for box in self.short_boxes[:]:
-            if row["Close"] > box[1]:
-                self.short_boxes.remove(box)
-                if i - self.last_down_index < 1000 and i > self.last_long_index:
-                    self.long_boxes.append(
-                        (self.last_down_index, self.last_down, self.last_low))
-                    if self.show_bullish_bos:
-                        candle_colour_mode = 1
-                        self.bos_lines.append(
-                            (self.data.index[self.last_down_index], self.last_down,
-                             row.name, self.last_down, candle_colour_mode)
-                        )
-                    self.last_long_index = i
-
-    def _detect_long_boxes(self, row: pd.Series) -> None:
+        trackers = _last_candle_trackers(
+            self._open, self._high, self._low, self._close, self.range_candle)
+        return (self._low, self._close, *trackers)
+
+    def _store_results(self, long_start: np.ndarray, long_high: np.ndarray,
+                       long_low: np.ndarray, short_start: np.ndarray,
+                       short_high: np.ndarray, short_low: np.ndarray,
+                       bos_index: np.ndarray,
+                       bos_price: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Detects long order blocks in the given row of data.
+        Packs the kernel output arrays into the detector's structured arrays.
 
         Args:
-            row (pd.Series): A current row in data.
-        """
-        for box in self.long_boxes[:]:
-            if row["Close"] < box[2]:
-                self.long_boxes.remove(box)
+            long_start (np.ndarray): Start positions of the long order blocks.
+            long_high (np.ndarray): Highs of the long order blocks.
+            long_low (np.ndarray): Lows of the long order blocks.
+            short_start (np.ndarray): Start positions of the short order blocks.
+            short_high (np.ndarray): Highs of the short order blocks.
+            short_low (np.ndarray): Lows of the short order blocks.
+            bos_index (np.ndarray): (start_index, end_index, colour_mode)
+                rows of the BOS lines.
+            bos_price (np.ndarray): (start_y, end_y) rows of the BOS lines.
 
-    def _update_last_indices(self, row: pd.Series, i: int) -> None:
+        Returns:
+            tuple: The long_boxes, short_boxes and bos_lines arrays.
         """
-        Updates the indices and values for the last up and down candles.
+        self.long_boxes = _box_records(long_start, long_high, long_low)
+        self.short_boxes = _box_records(short_start, short_high, short_low)
+        self.bos_lines = np.empty(len(bos_index), dtype=BOS_DTYPE)
+        self.bos_lines["start_idx"] = bos_index[:, 0]
+        self.bos_lines["y0"] = bos_price[:, 0]
+        self.bos_lines["end_idx"] = bos_index[:, 1]
+        self.bos_lines["y1"] = bos_price[:, 1]
+        self.bos_lines["mode"] = bos_index[:, 2]
+        return self.long_boxes, self.short_boxes, self.bos_lines
+
+
+def _box_records(start: np.ndarray, high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """
+    Converts the box columns of the detection kernel into BOX_DTYPE records.
+
+    Args:
+        start (np.ndarray): Start positions of the boxes.
+        high (np.ndarray): Highs of the boxes.
+        low (np.ndarray): Lows of the boxes.
+
+    Returns:
+        np.ndarray: One BOX_DTYPE record per box.
+    """
+    records = np.empty(len(start), dtype=BOX_DTYPE)
+    records["start_idx"] = start
+    records["high"] = high
+    records["low"] = low
+    return records
 
-        Args:
-            row (pd.Series): A current row in data.
-            i (int): The current index in the data.
-        """
-        if row["Close"] < row["Open"]:
-            self.last_down = row["High"]
-            self.last_down_index = i
-            self.last_low = row["Low"]
-        if row["Close"] > row["Open"]:
-            self.last_up_index = i
-            self.last_up_low = row["Low"]
-            self.last_high = row["High"]
-        self.last_high = max(row["High"], self.last_high)
-        self.last_low = min(row["Low"], self.last_low)
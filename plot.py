@@ -1,11 +1,314 @@
 from utils import *
 
 
+def _wall_clock(index: pd.DatetimeIndex) -> np.ndarray:
+    """Return the index as datetime64 values in its local wall-clock time.
+
+    Plotly places tz-aware timestamps by their wall-clock time, while the raw
+    values of a tz-aware index are in UTC, so the timezone is dropped first.
+
+    Args:
+        index (pandas.DatetimeIndex): The index of the market data.
+
+    Returns:
+        numpy.ndarray: The timestamps as datetime64[ns] without a timezone.
+    """
+    return (index.tz_localize(None) if index.tz else index).to_numpy()
+
+
+def _ohlc_polyline(x: np.ndarray, data: pd.DataFrame, mask: np.ndarray, colour: str) -> go.Scattergl:
+    """Draw the bars selected by mask as one WebGL polyline.
+
+    Each bar becomes four points at its timestamp, going through its open,
+    high, low and close, followed by a NaN that breaks the line before the
+    next bar. The result is a vertical stroke over the bar's range.
+
+    Args:
+        x (numpy.ndarray): The wall-clock timestamps of all bars.
+        data (pandas.DataFrame): A DataFrame with columns labeled 'Open',
+                                 'High', 'Low', and 'Close'.
+        mask (numpy.ndarray): Boolean array selecting the bars to draw.
+        colour (str): Line colour of the bars.
+
+    Returns:
+        plotly.graph_objs.Scattergl: The trace with all selected bars.
+    """
+    points = np.column_stack([data[column].to_numpy()[mask]
+                              for column in ("Open", "High", "Low", "Close")]
+                             + [np.full(mask.sum(), np.nan)])
+    return go.Scattergl(
+        x=np.repeat(x[mask], points.shape[1]),
+        y=points.ravel(),
+        mode="lines",
+        line=dict(width=CANDLE_WIDTH, color=colour),
+        showlegend=False,
+    )
+
+
+def _downsample(data: pd.DataFrame, max_bars: int) -> pd.DataFrame:
+    """Aggregate the price bars into at most about max_bars equal time bins.
+
+    Every bin keeps the first open, highest high, lowest low and last
+    close of the bars inside it, so the candles still cover the full
+    price range. Bins without any bars, e.g. outside trading hours, are
+    dropped.
+
+    Args:
+        data (pandas.DataFrame): A DataFrame with a DateTimeIndex and
+                                 columns labeled 'Open', 'High', 'Low',
+                                 and 'Close'.
+        max_bars (int): The number of bins to spread the data over.
+
+    Returns:
+        pandas.DataFrame: The aggregated 'Open', 'High', 'Low' and 'Close'
+                          columns, one row per non-empty bin.
+    """
+    span = (data.index[-1] - data.index[0]).total_seconds()
+    rule = pd.Timedelta(seconds=np.ceil(span / max_bars))
+    return data.resample(rule).agg(
+        {"Open": "first", "High": "max", "Low": "min", "Close": "last"}
+    ).dropna()
+
+
+def candlestick_traces(data: pd.DataFrame) -> list:
+    """Build the price traces of the chart for data.
+
+    The prices are handed to Plotly as NumPy arrays. Series longer than
+    WEBGL_BAR_THRESHOLD bars are drawn as WebGL polylines, one per candle
+    colour, since browsers slow down badly when rendering that many SVG
+    candles. Series longer than MAX_PLOT_BARS bars are first resampled to
+    about MAX_PLOT_BARS candles, which also keeps the figure JSON small.
+    The overlays stay at full resolution, as the date axis places them
+    by time rather than by candle.
+
+    Args:
+        data (pandas.DataFrame): A DataFrame with a DateTimeIndex and
+                                columns labeled 'Open', 'High',
+                                'Low', and 'Close' that contain the price data.
+
+    Returns:
+        list: The Plotly traces that draw the price movements.
+    """
+    if len(data) > MAX_PLOT_BARS:
+        data = _downsample(data, MAX_PLOT_BARS)
+    x = _wall_clock(data.index)
+    if len(data) > WEBGL_BAR_THRESHOLD:
+        increasing = data["Close"].to_numpy() > data["Open"].to_numpy()
+        return [
+            _ohlc_polyline(x, data, increasing, "green"),
+            _ohlc_polyline(x, data, ~increasing, "red"),
+        ]
+    return [
+        go.Candlestick(
+            x=x,
+            open=data["Open"].to_numpy(),
+            high=data["High"].to_numpy(),
+            low=data["Low"].to_numpy(),
+            close=data["Close"].to_numpy(),
+            increasing=dict(
+                line=dict(width=CANDLE_WIDTH, color="green")),
+            decreasing=dict(
+                line=dict(width=CANDLE_WIDTH, color="red"))
+        )
+    ]
+
+
+def pdh_pdl_layout(data: pd.DataFrame) -> tuple[list[dict], list[dict]]:
+    """Build the horizontal (PDH) and (PDL) lines and their labels.
+
+    The first row of the previous day is found by a binary search on the
+    sorted index, so no per-row date objects are built, and the two levels
+    are read as scalars from the row before it, so no shifted 'PDH' and
+    'PDL' columns are needed.
+
+    Args:
+        data (pandas.DataFrame): A DataFrame that includes a DateTimeIndex
+                                 and columns 'High' and 'Low' among others.
+                                 The DataFrame should cover at least the
+                                 previous day's data.
+
+    Returns:
+        tuple: The line shapes and the label annotations as plain dicts,
+            both empty when SHOW_PD is off or the previous day is missing.
+    """
+    if not SHOW_PD:
+        return [], []
+    today = datetime.date.today()
+    day_start = pd.Timestamp(today - datetime.timedelta(days=1), tz=data.index.tz)
+    day_end = pd.Timestamp(today, tz=data.index.tz)
+    position = data.index.searchsorted(day_start)
+    if not (0 < position < len(data) and data.index[position] < day_end):
+        return [], []
+    pdh = data["High"].iat[position - 1]
+    pdl = data["Low"].iat[position - 1]
+    levels = ((pdh, "PDH", "Blue"), (pdl, "PDL", "Red"))
+    shapes = [
+        dict(
+            type="line",
+            x0=0,
+            x1=1,
+            xref="paper",
+            y0=level,
+            y1=level,
+            yref="y",
+            line=dict(color=colour, width=1),
+        )
+        for level, _, colour in levels
+    ]
+    annotations = [
+        dict(
+            x=1,
+            xref="paper",
+            y=level,
+            text=text,
+            showarrow=False,
+            bgcolor=colour,
+            font=dict(color="white"),
+            xanchor="left",
+        )
+        for level, text, colour in levels
+    ]
+    return shapes, annotations
+
+
+def _filled_rects(x: np.ndarray, boxes: np.ndarray, colour: str) -> go.Scatter:
+    """Draw order blocks as the sub-polygons of one filled Scatter trace.
+
+    Each box becomes a closed rectangle from its start bar to the last bar,
+    followed by a NaN point that separates it from the next box, so the
+    browser draws all boxes as a single SVG path.
+
+    Args:
+        x (numpy.ndarray): The wall-clock timestamps of all bars.
+        boxes (numpy.ndarray): Structured array of order blocks with the
+            fields 'start_idx', 'high' and 'low'.
+        colour (str): Fill and outline colour of the boxes.
+
+    Returns:
+        plotly.graph_objs.Scatter: The trace with all boxes.
+    """
+    x0 = x[boxes["start_idx"]]
+    x1 = np.full(len(boxes), x[-1])
+    gap = np.full(len(boxes), np.datetime64("NaT"))
+    low = boxes["low"].astype(np.float64)
+    high = boxes["high"].astype(np.float64)
+    return go.Scatter(
+        x=np.column_stack((x0, x1, x1, x0, x0, gap)).ravel(),
+        y=np.column_stack((low, low, high, high, low, np.full(len(boxes), np.nan))).ravel(),
+        mode="lines",
+        fill="toself",
+        fillcolor=colour,
+        line=dict(color=colour),
+        hoverinfo="skip",
+        showlegend=False,
+    )
+
+
+def order_block_traces(x: np.ndarray, long_boxes: np.ndarray,
+                       short_boxes: np.ndarray) -> list:
+    """Build filled rectangle traces for long and short order blocks.
+
+    All long blocks share one trace and all short blocks another, instead
+    of one layout shape and SVG element per block.
+
+    Args:
+        x (numpy.ndarray): The wall-clock timestamps of the bars the blocks
+            were detected on, as returned by _wall_clock.
+        long_boxes (numpy.ndarray): Structured array of long order blocks
+            with the fields 'start_idx', 'high' and 'low', as returned by
+            OrderBlockDetector.detect_order_blocks_bos.
+        short_boxes (numpy.ndarray): Structured array of short order blocks
+            with the same fields as long_boxes.
+
+    Returns:
+        list: The long and short order block traces, with each block
+            reaching from its start to the last bar.
+    """
+    return [
+        _filled_rects(x, long_boxes, BULLISH_OB_COLOUR),
+        _filled_rects(x, short_boxes, BEARISH_OB_COLOUR),
+    ]
+
+
+def bos_line_shapes(x: np.ndarray, bos_lines: np.ndarray) -> list[dict]:
+    """Build line shapes for BOS (Break of Structure) lines.
+
+    The color of each line is determined by a specific field of the line
+    record, allowing visualization of different types of BOS events:
+    bearish (red), bullish (green). The lines refer to bars by position,
+    and all their timestamps are gathered from x at once.
+
+    Args:
+        x (numpy.ndarray): The wall-clock timestamps of the bars the lines
+            were detected on, as returned by _wall_clock.
+        bos_lines (numpy.ndarray): Structured array holding the data needed
+            to plot each line, with the fields
+            ('start_idx', 'y0', 'end_idx', 'y1', 'mode'),
+            where 'mode' is 0 for red, 1 for green.
+
+    Returns:
+        list: One plain dict line per BOS line.
+    """
+    return [
+        dict(
+            type="line",
+            x0=x0,
+            x1=x1,
+            y0=y0,
+            y1=y1,
+            line=dict(color='red' if mode == 0 else 'green'),
+        )
+        for x0, y0, x1, y1, mode in zip(x[bos_lines["start_idx"]],
+                                        bos_lines["y0"].tolist(),
+                                        x[bos_lines["end_idx"]],
+                                        bos_lines["y1"].tolist(),
+                                        bos_lines["mode"].tolist())
+    ]
+
+
+def build_chart(data: pd.DataFrame, long_boxes: np.ndarray, short_boxes: np.ndarray,
+                bos_lines: np.ndarray, ticker: str, period: str) -> go.Figure:
+    """Build the complete order block chart in a single Figure construction.
+
+    All traces, shapes and annotations are collected first and the figure
+    is created once with its whole layout, so Plotly validates the layout a
+    single time instead of once per added element. The wall-clock
+    timestamps of the bars are built once and shared by the overlays.
+
+    Args:
+        data (pandas.DataFrame): The price data with a DateTimeIndex,
+            as used by the detector.
+        long_boxes (numpy.ndarray): Structured array of long order blocks.
+        short_boxes (numpy.ndarray): Structured array of short order blocks.
+        bos_lines (numpy.ndarray): Structured array of BOS lines.
+        ticker (str): The ticker symbol of the stock, used in the titles.
+        period (str): The time period of the data, used in the title.
+
+    Returns:
+        plotly.graph_objs.Figure: The finished figure, ready for presentation.
+    """
+    shapes, annotations = pdh_pdl_layout(data)
+    x = _wall_clock(data.index)
+    shapes += bos_line_shapes(x, bos_lines)
+    return go.Figure(
+        data=candlestick_traces(data) + order_block_traces(x, long_boxes, short_boxes),
+        layout=go.Layout(
+            title=ticker + " Stock Price for " + period,
+            yaxis_title=ticker + "Stock",
+            xaxis_rangeslider_visible=False,
+            shapes=shapes,
+            annotations=annotations,
+        )
+    )
+
+
 def initialize_plot(data: pd.DataFrame) -> go.Figure:
     """Initialize a candlestick chart for data using Plotly.
 
     This function takes a DataFrame that contains financial market data and
-    creates a candlestick chart representing the price movements.
+    creates a candlestick chart representing the price movements, using the
+    traces from candlestick_traces. The range slider is switched off in the
+    same constructor call, so the figure is validated once.
 
     Args:
         data (pandas.DataFrame): A DataFrame with a DateTimeIndex and
@@ -17,168 +320,76 @@ def initialize_plot(data: pd.DataFrame) -> go.Figure:
                                   the candlestick chart, ready to be displayed
                                   or further customized.
     """
-    fig = go.Figure(
-        data=[
-            go.Candlestick(
-                x=data.index,
-                open=data["Open"],
-                high=data["High"],
-                low=data["Low"],
-                close=data["Close"],
-                increasing=dict(
-                    line=dict(width=CANDLE_WIDTH, color="green")),
-                decreasing=dict(
-                    line=dict(width=CANDLE_WIDTH, color="red"))
-            )
-        ]
+    return go.Figure(
+        data=candlestick_traces(data),
+        layout=dict(xaxis_rangeslider_visible=False)
     )
-    return fig
 
 
 def add_pdh_pdl_to_plot(fig: go.Figure, data: pd.DataFrame) -> go.Figure:
     """Add horizontal lines for (PDH) and (PDL) to a Plotly candlestick chart.
 
-    This function calculates the PDH and PDL for the previous day from the
-    provided data and adds horizontal lines at these levels on the plot.
-    The lines help to visually assess current day's movements to the previous.
+    This function adds the lines and labels built by pdh_pdl_layout to the
+    plot. The lines help to visually assess current day's movements to the
+    previous. They are appended to the layout in one update each.
 
     Args:
         fig (plotly.graph_objs.Figure): The existing Plotly Figure object
                                         that contains the candlestick chart.
         data (pandas.DataFrame): A DataFrame that includes a DateTimeIndex
-                                 and columns 'PDH' and 'PDL' among others.
-                                 The DataFrame should cover at least the
-                                 previous day's data.
+                                 and columns 'High' and 'Low' among others.
 
     Returns:
         fig (plotly.graph_objs.Figure): Modified Plotly Figure object
                                         that contains the candlestick chart
                                         and PDH and PDL lines.
     """
-    if SHOW_PD:
-        yesterday = datetime.date.today() - datetime.timedelta(days=1)
-        yesterday_data = data.loc[data.index.date == yesterday]
-        if not yesterday_data.empty:
-            pdh = yesterday_data["PDH"].values[0]
-            pdl = yesterday_data["PDL"].values[0]
-            fig.add_shape(
-                type="line",
-                x0=0,
-                x1=1,
-                xref="paper",
-                y0=pdh,
-                y1=pdh,
-                yref="y",
-                line=dict(color="Blue", width=1),
-            )
-            fig.add_annotation(
-                x=1,
-                xref="paper",
-                y=pdh,
-                text="PDH",
-                showarrow=False,
-                bgcolor="Blue",
-                font=dict(color="white"),
-                xanchor="left",
-            )
-            fig.add_shape(
-                type="line",
-                x0=0,
-                x1=1,
-                xref="paper",
-                y0=pdl,
-                y1=pdl,
-                yref="y",
-                line=dict(color="Red", width=1),
-            )
-            fig.add_annotation(
-                x=1,
-                xref="paper",
-                y=pdl,
-                text="PDL",
-                showarrow=False,
-                bgcolor="Red",
-                font=dict(color="white"),
-                xanchor="left",
-            )
+    shapes, annotations = pdh_pdl_layout(data)
+    if shapes:
+        fig.layout.shapes = fig.layout.shapes + tuple(shapes)
+        fig.layout.annotations = fig.layout.annotations + tuple(annotations)
     return fig
 
 
-def add_order_blocks_to_plot(fig: go.Figure, data: pd.DataFrame, long_boxes: list[tuple],
-                             short_boxes: list[tuple]) -> go.Figure:
+def add_order_blocks_to_plot(fig: go.Figure, data: pd.DataFrame, long_boxes: np.ndarray,
+                             short_boxes: np.ndarray) -> go.Figure:
     """Render representations of long and short order blocks to Plotly figure.
 
-    This function iterates over lists of long and short order blocks
-    and adds corresponding rectangle shapes to a Plotly figure to visually
-    represent these blocks on the chart.
+    This function adds the filled rectangle traces built by
+    order_block_traces to the figure, one trace per kind of block.
 
     Args:
         fig (plotly.graph_obs.Figure): The Plotly figure object to which
-            the order block shapes will be added.
-        data (pandas.DataFrame): The DataFrame containing the financial data,
-            which must have an index that Plotly can use to
-            place the rectangles on the x-axis.
-        long_boxes (list of tuples): Each tuple contains indices and prices
-            defining a long order block. Specifically, tuples are expected
-            in the format (start_index, high_price, low_price)
-        short_boxes (list of tuples): Each tuple contains indices and prices
-            defining a short order block. The format is similar to long_boxes.
+            the order block traces will be added.
+        data (pandas.DataFrame): The DataFrame containing the financial data.
+        long_boxes (numpy.ndarray): Structured array of long order blocks.
+        short_boxes (numpy.ndarray): Structured array of short order blocks.
 
     Returns:
-        plotly.graph_objs.Figure: The modified figure object with
-            added shapes for order blocks.
+        plotly.graph_objs.Figure: The modified figure object with two
+            added filled Scatter traces, one for the long and one for the
+            short order blocks.
     """
-    for box in long_boxes:
-        fig.add_shape(
-            type="rect",
-            x0=data.index[box[0]],
-            x1=data.index[-1],
-            y0=box[2],
-            y1=box[1],
-            line=dict(color=BULLISH_OB_COLOUR),
-            fillcolor=BULLISH_OB_COLOUR,
-        )
-    for box in short_boxes:
-        fig.add_shape(
-            type="rect",
-            x0=data.index[box[0]],
-            x1=data.index[-1],
-            y0=box[2],
-            y1=box[1],
-            line=dict(color=BEARISH_OB_COLOUR),
-            fillcolor=BEARISH_OB_COLOUR,
-        )
+    fig.add_traces(order_block_traces(_wall_clock(data.index), long_boxes, short_boxes))
     return fig
 
 
-def add_bos_lines_to_plot(fig: go.Figure, bos_lines: list[tuple]) -> go.Figure:
+def add_bos_lines_to_plot(fig: go.Figure, data: pd.DataFrame, bos_lines: np.ndarray) -> go.Figure:
     """Add BOS (Break of Structure) lines to a Plotly figure.
 
-    This function iterates over a list of BOS lines and adds corresponding
-    lines to a Plotly figure. The color of each line is determined by a
-    specific value in the line tuple, allowing visualization
-    of different types of BOS events: bearish (red), bullish (green).
+    This function adds the lines built by bos_line_shapes to the figure in
+    a single layout update.
 
     Args:
         fig (plotly.graph_objs.Figure): The Plotly figure object
             to which the BOS lines will be added.
-        bos_lines (list of tuples): Each tuple contains the data needed
-            to plot a line. Expected tuple format is
-            (start_x, start_y, end_x, end_y, color_code),
-            where 'color_code' is 0 for red, 1 for green.
+        data (pandas.DataFrame): The DataFrame the lines were detected on.
+        bos_lines (numpy.ndarray): Structured array of BOS lines.
 
     Returns:
         plotly.graph_objs.Figure: The modified figure with added BOS lines.
     """
-    for line in bos_lines:
-        fig.add_shape(
-            type="line",
-            x0=line[0],
-            x1=line[2],
-            y0=line[1],
-            y1=line[3],
-            line=dict(color='red' if line[4] == 0 else 'green'),
-        )
+    fig.layout.shapes = fig.layout.shapes + tuple(bos_line_shapes(_wall_clock(data.index), bos_lines))
     return fig
 
 
@@ -189,9 +400,8 @@ def finalize_plot(fig: go.Figure, ticker: str, period: str) -> go.Figure:
     This function updates the layout of a given Plotly figure to include a
     title that reflects the stock ticker and the time period over which the
     data is displayed. It also sets up the y-axis title to indicate
-    it's displaying stock information, and hides the x-axis range slider
-    typically used for dynamic temporal scaling, for a cleaner and more
-    focused presentation.
+    it's displaying stock information. The x-axis range slider is already
+    hidden by initialize_plot.
 
     Args:
         fig (plotly.graph_objs.Figure): The Plotly figure that is finalized.
@@ -207,7 +417,6 @@ def finalize_plot(fig: go.Figure, ticker: str, period: str) -> go.Figure:
     """
     fig.update_layout(
         title=ticker + " Stock Price for " + period,
-        yaxis_title=ticker + "Stock",
-        xaxis_rangeslider_visible=False
+        yaxis_title=ticker + "Stock"
     )
     return fig
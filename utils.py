@@ -1,14 +1,36 @@
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 import datetime
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE: bool = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 TICKER = "AAPL"
 PERIOD = "2y"
+WATCHLIST: list[str] = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA"]
+
+CACHE_DIR: Path = Path(".cache")
 
 CANDLE_WIDTH: float = 0.5
+WEBGL_BAR_THRESHOLD: int = 5000
+MAX_PLOT_BARS: int = 20000
 RANGE_CANDLE: int = 15
 
 SHOW_PD: bool = True
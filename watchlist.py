@@ -0,0 +1,54 @@
+"""This file is calculating and rendering Order Block indicator for a watchlist."""
+
+from utils import *
+import data_fetcher
+import order_block_detector
+import plot
+
+
+def analyze(ticker: str, data: pd.DataFrame, period: str) -> go.Figure:
+    """Run the order block pipeline of main.py on one ticker's data.
+
+    Args:
+        ticker (str): The stock ticker symbol, used in the chart titles.
+        data (pandas.DataFrame): The historical market data of the ticker.
+        period (str): The time period of the data, used in the chart title.
+
+    Returns:
+        plotly.graph_objs.Figure: The finished order block chart.
+    """
+    detector = order_block_detector.OrderBlockDetector(data)
+    long_boxes, short_boxes, bos_lines = detector.detect_order_blocks_bos()
+    return plot.build_chart(data, long_boxes, short_boxes, bos_lines, ticker, period)
+
+
+def analyze_watchlist(tickers: list[str], period: str,
+                      max_workers: int = os.cpu_count()) -> dict[str, go.Figure]:
+    """Build order block charts for several tickers in parallel.
+
+    All tickers are downloaded with one threaded fetch_watchlist_data call,
+    so the network requests overlap without going through the process pool.
+    The CPU-bound processing, detection and chart building then runs in a
+    ProcessPoolExecutor, one ticker per task.
+
+    Args:
+        tickers (list of str): The stock ticker symbols to analyze.
+        period (str): The time period over which to fetch the data.
+        max_workers (int, optional): The number of worker processes.
+                                     Default is the number of CPUs.
+
+    Returns:
+        dict: Ticker symbols mapped to their charts, in the order of
+              tickers. Tickers without data are left out.
+    """
+    frames = data_fetcher.fetch_watchlist_data(tickers, period)
+    frames = {ticker: data for ticker, data in frames.items() if not data.empty}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        figures = executor.map(analyze, frames, frames.values(),
+                               [period] * len(frames))
+        return dict(zip(frames, figures))
+
+
+if __name__ == "__main__":
+    for chart in analyze_watchlist(WATCHLIST, PERIOD).values():
+        chart.show()